@@ -30,11 +30,7 @@ async def async_setup_entry(
     """Set up this integration using UI."""
     hass.data.setdefault(DOMAIN, {})
 
-    coordinator = await hass.async_add_executor_job(
-        HaUsmsDataUpdateCoordinator,
-        hass,
-        entry,
-    )
+    coordinator = HaUsmsDataUpdateCoordinator(hass, entry)
     await coordinator.async_config_entry_first_refresh()
 
     if not coordinator.data:
@@ -60,7 +56,13 @@ async def async_unload_entry(
     entry: HaUsmsConfigEntry,
 ) -> bool:
     """Handle removal of an entry."""
-    return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    coordinator = hass.data[DOMAIN][entry.entry_id].coordinator
+
+    unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
+    if unload_ok:
+        await coordinator.async_shutdown()
+
+    return unload_ok
 
 
 async def async_reload_entry(
@@ -1,7 +1,23 @@
 """Constants for ha_usms."""
 
+from datetime import timedelta
 from logging import Logger, getLogger
 
 LOGGER: Logger = getLogger(__package__)
 
 DOMAIN = "ha_usms"
+
+"""Number of updates after which consumptions are always re-fetched."""
+CONSUMPTIONS_REFETCH_CYCLES = 6
+
+"""Offset from an hourly consumption's end time to its statistic's start time."""
+ONE_HOUR = timedelta(hours=1)
+
+"""Fewest observed gaps longer than the elapsed time to estimate a late retry from."""
+RETRY_ESTIMATE_MIN_GAPS = 3
+
+"""Seconds within which repeated refresh requests are collapsed into one."""
+REQUEST_REFRESH_COOLDOWN = 60.0
+
+"""Number of statistics rows imported to the database at a time."""
+IMPORT_CHUNK_SIZE = 1000
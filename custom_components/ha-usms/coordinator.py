@@ -2,24 +2,79 @@
 
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from itertools import accumulate
+from statistics import median
 from typing import TYPE_CHECKING, Any
 
 from homeassistant.components import recorder
 from homeassistant.components.recorder.statistics import statistics_during_period
 from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-from usms import USMSAccount, USMSConsumptionHistoryNotFoundError, USMSMeter
-
-from .const import DOMAIN, LOGGER
+from homeassistant.util import dt as dt_util
+from usms import (
+    USMSAccount,
+    USMSConsumptionHistoryNotFoundError,
+    USMSLoginError,
+    USMSMeter,
+)
+
+from .const import (
+    CONSUMPTIONS_REFETCH_CYCLES,
+    DOMAIN,
+    LOGGER,
+    ONE_HOUR,
+    REQUEST_REFRESH_COOLDOWN,
+    RETRY_ESTIMATE_MIN_GAPS,
+)
 
 if TYPE_CHECKING:
+    import asyncio
+    from collections.abc import Callable
+
     from homeassistant.components.recorder.models.statistics import StatisticData
     from homeassistant.core import HomeAssistant
 
     from .data import HaUsmsConfigEntry
 
 
+def get_hourly_consumptions_range(
+    meter: USMSMeter,
+    start_date: datetime,
+    end_date: datetime,
+) -> dict[datetime, float]:
+    """
+    Return the hourly consumptions of a meter from the start to the end date.
+
+    USMS only reports hourly consumptions for up to one day per request,
+    so every day is still requested separately, but within a single job.
+    Days without any consumption history yet are skipped.
+    """
+    hourly_consumptions = {}
+
+    iter_date = start_date
+    while iter_date <= end_date:
+        try:
+            LOGGER.debug(
+                "Retrieving consumptions for USMS meter %s for %s.",
+                meter.no,
+                iter_date.date(),
+            )
+            hourly_consumptions.update(meter.get_hourly_consumptions(iter_date))
+        except USMSConsumptionHistoryNotFoundError:
+            LOGGER.error(
+                "Consumptions not found yet for USMS meter %s for %s.",
+                meter.no,
+                iter_date.date(),
+            )
+        iter_date += timedelta(days=1)
+
+    return hourly_consumptions
+
+
 class HaUsmsDataUpdateCoordinator(DataUpdateCoordinator):
     """Class to manage fetching data from the API."""
 
@@ -31,34 +86,136 @@ class HaUsmsDataUpdateCoordinator(DataUpdateCoordinator):
         entry: HaUsmsConfigEntry,
     ) -> None:
         """Initialize coordinator."""
-        username = entry.data[CONF_USERNAME]
-        password = entry.data[CONF_PASSWORD]
+        self._username = entry.data[CONF_USERNAME]
+        self._password = entry.data[CONF_PASSWORD]
 
         super().__init__(
             hass=hass,
             logger=LOGGER,
             name=DOMAIN,
+            request_refresh_debouncer=Debouncer(
+                hass,
+                LOGGER,
+                cooldown=REQUEST_REFRESH_COOLDOWN,
+                immediate=True,
+            ),
         )
 
-        self.account = USMSAccount(username, password)
+        """The account is only logged in to on the first update."""
+        self.account: USMSAccount | None = None
         self.meter_consumptions = {}
 
+        """Observed seconds between consecutive USMS updates."""
+        self._gap_history: deque[float] = deque(maxlen=200)
+        self._latest_update: datetime | None = None
+
+        """Last update time of each meter when its consumptions were fetched."""
+        self._last_seen: dict[str, datetime] = {}
+        self._update_count = 0
+
+        """
+        Blocking USMS calls run on their own executor,
+        so that slow USMS responses cannot starve Home Assistant's shared one.
+        It has a single worker, since the USMS client is not thread-safe,
+        which also keeps every call on the account's session in order.
+        """
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="usms")
+
+    def async_add_usms_job[_T](
+        self,
+        target: Callable[..., _T],
+        *args: Any,
+    ) -> asyncio.Future[_T]:
+        """Run a blocking USMS call on the dedicated executor."""
+        return self.hass.loop.run_in_executor(self._executor, target, *args)
+
+    async def async_shutdown(self) -> None:
+        """Shut down the coordinator and its executor."""
+        await super().async_shutdown()
+        self._executor.shutdown(wait=False)
+
+    async def _async_log_in(self) -> None:
+        """Log in to the USMS account."""
+        try:
+            self.account = await self.async_add_usms_job(
+                USMSAccount,
+                self._username,
+                self._password,
+            )
+        except USMSLoginError as error:
+            raise UpdateFailed(error) from error
+
+    def _record_update_gap(self, latest_update: datetime) -> bool:
+        """
+        Record the gap since the previous USMS update, if a new one was seen.
+
+        Return whether the latest update moved forward since the previous one.
+        """
+        new_update_seen = bool(
+            self._latest_update and latest_update > self._latest_update
+        )
+        if new_update_seen:
+            gap = latest_update - self._latest_update
+            self._gap_history.append(gap.total_seconds())
+        self._latest_update = latest_update
+        return new_update_seen
+
+    def _estimate_update_gap(self) -> timedelta:
+        """Return the typical gap between USMS updates, 1 hour if none seen yet."""
+        if not self._gap_history:
+            return timedelta(hours=1)
+        return timedelta(seconds=median(self._gap_history))
+
+    def _estimate_retry_interval(self, elapsed: timedelta) -> timedelta:
+        """
+        Return how long to wait before checking for a late update again.
+
+        Only the observed gaps longer than the time already elapsed are still
+        possible, so the next check is placed at the median of those,
+        but never sooner than 5 minutes nor later than 1 hour from now.
+        With too few of those gaps to go by, e.g. a single missed update,
+        it simply checks again in 5 minutes.
+        """
+        retry_interval = timedelta(minutes=5)
+
+        elapsed_seconds = elapsed.total_seconds()
+        remaining_gaps = [gap for gap in self._gap_history if gap > elapsed_seconds]
+        if len(remaining_gaps) >= RETRY_ESTIMATE_MIN_GAPS:
+            expected_wait = timedelta(seconds=median(remaining_gaps)) - elapsed
+            retry_interval = min(max(retry_interval, expected_wait), timedelta(hours=1))
+
+        return retry_interval
+
     async def _async_update_data(self) -> dict:  # noqa: PLR0912, PLR0915
         """Update data via library."""
-        LOGGER.debug(f"Retrieving updates for USMS account {self.account.reg_no}.")
+        if self.account is None:
+            await self._async_log_in()
+
+        LOGGER.debug("Retrieving updates for USMS account %s.", self.account.reg_no)
 
         """Log out first"""
         """Might help account to be updated more consistently on USMS's side?"""
-        self.account.log_out()
+        await self.async_add_usms_job(self.account.log_out)
 
-        """Check for updates for every meter."""
-        for meter in self.account.meters:
-            LOGGER.debug(f"Retrieving updates for USMS meter {meter.no}.")
-            success = await self.hass.async_add_executor_job(meter.update, True)  # noqa: FBT003
+        meters = list(self.account.meters)
+        now = dt_util.now(time_zone=USMSMeter.TIMEZONE)
+        today = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        yesterday = today - timedelta(days=1)
+
+        self._update_count += 1
+        refetch_due = self._update_count % CONSUMPTIONS_REFETCH_CYCLES == 0
+
+        """
+        Check for updates for every meter, one at a time,
+        since all meters share the account's single USMS session.
+        """
+        for meter in meters:
+            LOGGER.debug("Retrieving updates for USMS meter %s.", meter.no)
+            success = await self.async_add_usms_job(meter.update, True)  # noqa: FBT003
 
             if success:
-                LOGGER.debug(f"Retrieved update for USMS meter {meter.no}.")
-                LOGGER.debug(f"Last updated on {meter.get_last_updated()}.")
+                LOGGER.debug("Retrieved update for USMS meter %s.", meter.no)
+                LOGGER.debug("Last updated on %s.", meter.get_last_updated())
             else:
                 self.update_interval = timedelta(minutes=5)
                 error = f"Error retrieving update. Retry in {self.update_interval}"
@@ -67,17 +224,25 @@ class HaUsmsDataUpdateCoordinator(DataUpdateCoordinator):
 
         """
         Use the latest update time to estimate the next update time,
-        i.e. 1 hour after the latest update time.
+        i.e. the typical gap between past updates after the latest update time.
         """
         latest_update = self.account.get_latest_update()
-        next_update = latest_update + timedelta(hours=1)
-        now = datetime.now(tz=USMSMeter.TIMEZONE)
+        new_update_seen = self._record_update_gap(latest_update)
+        next_update = latest_update + self._estimate_update_gap()
         self.update_interval = next_update - now
 
+        """
+        USMS only shows an update a little while after its own timestamp,
+        so a new update seen this cycle can already look overdue.
+        That is not late; expect the next one after the same delay.
+        """
+        if next_update < now and new_update_seen:
+            self.update_interval = self._estimate_update_gap()
+
         """Check if the estimated next update time has been passed."""
-        if next_update < now:
-            """If so, check for new updates again in 5 minutes."""
-            self.update_interval = timedelta(minutes=5)
+        if next_update < now and not new_update_seen:
+            """If so, check for new updates again when it is next most likely."""
+            self.update_interval = self._estimate_retry_interval(now - latest_update)
 
             error = f"{now - latest_update} since last successful update. Retry in {self.update_interval}."  # noqa: E501
             LOGGER.error(error)
@@ -88,111 +253,113 @@ class HaUsmsDataUpdateCoordinator(DataUpdateCoordinator):
                 This prevents listeners from being called,
                 and making unnecessary writes to states everytime.
                 """
-                self.account.log_out()
+                await self.async_add_usms_job(self.account.log_out)
                 raise UpdateFailed(error)
 
-        data = {}
-        for meter in self.account.meters:
-            LOGGER.debug(f"Retrieving consumptions for USMS meter {meter.no}.")
+        meter_hourly_consumptions = {}
+        for meter in meters:
+            """
+            If the meter has not been updated since its consumptions were last
+            fetched, the previous statistics can be reused as they are,
+            except every few updates to still catch any stealthy corrections.
+            Statistics built before the sensor entity was added have no sums,
+            so those are never reused.
+            """
+            previous_statistics = self.data.get(meter.no) if self.data else None
+            if (
+                not refetch_due
+                and meter.get_last_updated() == self._last_seen.get(meter.no)
+                and previous_statistics
+                and "sum" in previous_statistics[0]
+            ):
+                LOGGER.debug("No new consumptions for USMS meter %s.", meter.no)
+                meter_hourly_consumptions[meter.no] = None
+                continue
 
-            today = now.replace(hour=0, minute=0, second=0, microsecond=0)
-            yesterday = today - timedelta(days=1)
+            LOGGER.debug("Retrieving consumptions for USMS meter %s.", meter.no)
 
             """
             Sometimes the data on the USMS site can be stealthily corrected,
             so we always re-import all hourly consumptions for the day,
             not just the latest consumption.
-            """
-            try:
-                LOGGER.debug(
-                    f"Retrieving consumptions for USMS meter {meter.no} for today."
-                )
-                hourly_consumptions = await self.hass.async_add_executor_job(
-                    meter.get_hourly_consumptions,
-                    today,
-                )
-            except USMSConsumptionHistoryNotFoundError:
-                hourly_consumptions = {}
-                LOGGER.error(
-                    f"Consumptions not found yet for USMS meter {meter.no} for today."
-                )
-
-            """
             Lets re-download yesterday's data as well to be safe.
             """
-            try:
-                LOGGER.debug(
-                    f"Retrieving consumptions for USMS meter {meter.no} for yesterday."
-                )
-                yesterday_hourly_consumptions = await self.hass.async_add_executor_job(
-                    meter.get_hourly_consumptions,
-                    yesterday,
-                )
-                hourly_consumptions.update(yesterday_hourly_consumptions)
-            except USMSConsumptionHistoryNotFoundError:
-                LOGGER.error(
-                    f"Consumptions not found yet for USMS meter {meter.no} for yesterday."  # noqa: E501
-                )
+            meter_hourly_consumptions[meter.no] = await self.async_add_usms_job(
+                get_hourly_consumptions_range,
+                meter,
+                yesterday,
+                today,
+            )
+
+        """
+        We want to find the last known correct sum state for every meter,
+        but for that we need the metadata from the meters' sensor entities,
+        so only meters with an added sensor entity are looked up,
+        and only if their consumptions were just fetched.
+        """
+        statistic_ids = [
+            self.meter_consumptions[meter.no].metadata["statistic_id"]
+            for meter in meters
+            if meter.no in self.meter_consumptions
+            and meter_hourly_consumptions[meter.no] is not None
+        ]
+        last_sums = {}
+        if statistic_ids:
+            """Only query for data up until two days ago, 11:59PM."""
+            last_sums = await self._async_get_last_sums(statistic_ids, yesterday)
+
+        data = {}
+        for meter in meters:
+            hourly_consumptions = meter_hourly_consumptions[meter.no]
+
+            """Reuse the previous statistics if there are no new consumptions."""
+            if hourly_consumptions is None:
+                data[meter.no] = self.data[meter.no]
+                continue
 
             """
             Skip calculating statistics for this meter if no consumption history found.
             """
             if hourly_consumptions == {}:
                 LOGGER.debug(
-                    f"Skipping statistics calculation for USMS meter {meter.no}."
+                    "Skipping statistics calculation for USMS meter %s.", meter.no
                 )
                 data[meter.no] = []
                 continue
 
             statistics = []
 
-            """
-            We want to find the last known correct sum state,
-            but for that we need the metadata from the meter's sensor entity.
-            """
             sensor = self.meter_consumptions.get(meter.no)
-            """So first check if the sensor entity for the meter has been added."""
+            """Check if the sensor entity for the meter has been added."""
             if sensor:
-                statistic_id = sensor.metadata["statistic_id"]
-
                 """
-                Only query for data up until two days ago.
+                If no statistic data is present in the database,
+                then this data is likely the first in the database.
                 """
-                end_time = yesterday  # until 2 days ago, 11:59PM
-
-                old_statistics_dict = await recorder.get_instance(
-                    self.hass
-                ).async_add_executor_job(
-                    statistics_during_period,
-                    self.hass,
-                    datetime.fromtimestamp(0, tz=USMSMeter.TIMEZONE),
-                    end_time,
-                    [statistic_id],
-                    "hour",
-                    None,
-                    ["sum"],
+                total = last_sums.get(sensor.metadata["statistic_id"], 0)
+
+                """Accumulate the sum states in a single pass over sorted hours."""
+                hours, consumptions = zip(
+                    *sorted(hourly_consumptions.items()), strict=True
                 )
-                old_statistics = old_statistics_dict.get(statistic_id)
-                """Make sure statistic data is present in the database."""
-                if old_statistics:
-                    total = old_statistics[-1]["sum"]
-                else:
-                    """If not, then this data is likely the first in the database."""
-                    total = 0
+                sums = accumulate(consumptions, initial=total)
+                next(sums)  # skip the initial, already known sum
 
-                for hourly, consumption in sorted(hourly_consumptions.items()):
-                    total += consumption
-                    statistic: StatisticData = {
-                        "start": hourly - timedelta(hours=1),
+                statistics = [
+                    {
+                        "start": hourly - ONE_HOUR,
                         "state": consumption,
-                        "sum": total,
+                        "sum": running_total,
                     }
-                    statistics.append(statistic)
+                    for hourly, consumption, running_total in zip(
+                        hours, consumptions, sums, strict=True
+                    )
+                ]
             else:
                 """If sensor entity not yet added, then no need to calculate sum."""
                 for hourly, consumption in hourly_consumptions.items():
                     statistic: StatisticData = {
-                        "start": hourly - timedelta(hours=1),
+                        "start": hourly - ONE_HOUR,
                         "state": consumption,
                     }
                     statistics.append(statistic)
@@ -200,9 +367,59 @@ class HaUsmsDataUpdateCoordinator(DataUpdateCoordinator):
             """Store statistics in data, to be imported by listener."""
             data[meter.no] = statistics
 
-        self.account.log_out()
+        """Only remember the fetched meters once their statistics are built."""
+        for meter in meters:
+            if meter_hourly_consumptions[meter.no] is not None:
+                self._last_seen[meter.no] = meter.get_last_updated()
 
-        LOGGER.debug(f"Retrieved updates for USMS account {self.account.reg_no}.")
-        LOGGER.debug(f"Next update is on {next_update}, in {self.update_interval}.")
+        await self.async_add_usms_job(self.account.log_out)
+
+        LOGGER.debug("Retrieved updates for USMS account %s.", self.account.reg_no)
+        LOGGER.debug("Next update is on %s, in %s.", next_update, self.update_interval)
 
         return data
+
+    async def _async_get_last_sums(
+        self,
+        statistic_ids: list[str],
+        end_time: datetime,
+    ) -> dict[str, float]:
+        """
+        Return the last known sum for each statistic before the given end time.
+
+        Only the single hour right before the end time is queried at first,
+        for all statistics at once, since only that final sum is needed.
+        Statistics without data for that hour are then looked up again
+        over their whole history.
+        """
+        last_sums = {}
+
+        for start_time in (
+            end_time - ONE_HOUR,
+            dt_util.utc_from_timestamp(0),
+        ):
+            missing_statistic_ids = [
+                statistic_id
+                for statistic_id in statistic_ids
+                if statistic_id not in last_sums
+            ]
+            if not missing_statistic_ids:
+                break
+
+            old_statistics_dict = await recorder.get_instance(
+                self.hass
+            ).async_add_executor_job(
+                statistics_during_period,
+                self.hass,
+                start_time,
+                end_time,
+                missing_statistic_ids,
+                "hour",
+                None,
+                ["sum"],
+            )
+            for statistic_id, old_statistics in old_statistics_dict.items():
+                if old_statistics:
+                    last_sums[statistic_id] = old_statistics[-1]["sum"]
+
+        return last_sums
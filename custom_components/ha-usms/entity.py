@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING
+
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .coordinator import HaUsmsDataUpdateCoordinator
 
+if TYPE_CHECKING:
+    from usms import USMSMeter
+
 
 class HaUsmsEntity(CoordinatorEntity[HaUsmsDataUpdateCoordinator]):
     """HaUsmsEntity class."""
@@ -13,14 +18,25 @@ class HaUsmsEntity(CoordinatorEntity[HaUsmsDataUpdateCoordinator]):
     coordinator: HaUsmsDataUpdateCoordinator
     _attr_has_entity_name = True
 
+    """Appended to the meter's name to name each of its entities."""
+    _name_suffix: str = ""
+
     def __init__(
         self,
         coordinator: HaUsmsDataUpdateCoordinator,
+        meter: USMSMeter,
     ) -> None:
         """Initialize."""
         super().__init__(coordinator)
 
-    @property
-    def unique_id(self) -> str:
-        """Return unique id."""
-        return f"{self.name}".lower().replace(" ", "_")
+        self.meter = meter
+
+        """The meter's details never change, so only look them up once."""
+        self._meter_type = meter.get_type()
+        self._meter_no = meter.get_no()
+        self._unit = meter.get_unit()
+
+        self._attr_name = (
+            f"{self._meter_type} Meter {self._meter_no}{self._name_suffix}"
+        )
+        self._attr_unique_id = self._attr_name.lower().replace(" ", "_")
@@ -25,6 +25,15 @@ if TYPE_CHECKING:
     from .coordinator import HaUsmsDataUpdateCoordinator
     from .data import HaUsmsConfigEntry
 
+_UNIT_DEVICE_CLASS = {
+    "Electricity": SensorDeviceClass.ENERGY_STORAGE,
+    "Water": SensorDeviceClass.WATER,
+}
+_CONSUMPTION_DEVICE_CLASS = {
+    "Electricity": SensorDeviceClass.ENERGY,
+    "Water": SensorDeviceClass.WATER,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -37,15 +46,21 @@ async def async_setup_entry(
     account = coordinator.account
     meters = account.meters
 
-    sensors = []
-    for meter in meters:
-        sensors.append(HaUsmsUtilityMeterRemainingUnit(coordinator, meter))
-        sensors.append(HaUsmsUtilityMeterRemainingCredit(coordinator, meter))
-        sensors.append(HaUsmsUtilityMeterLastUpdated(coordinator, meter))
-
-        utility_meter_consumption = HaUsmsUtilityMeterConsumption(coordinator, meter)
-        sensors.append(utility_meter_consumption)
-        coordinator.meter_consumptions[meter.no] = utility_meter_consumption
+    sensors = [
+        sensor_class(coordinator, meter)
+        for meter in meters
+        for sensor_class in (
+            HaUsmsUtilityMeterRemainingUnit,
+            HaUsmsUtilityMeterRemainingCredit,
+            HaUsmsUtilityMeterLastUpdated,
+            HaUsmsUtilityMeterConsumption,
+        )
+    ]
+
+    """The services look up consumption sensors by their meter number."""
+    for sensor in sensors:
+        if isinstance(sensor, HaUsmsUtilityMeterConsumption):
+            coordinator.meter_consumptions[sensor.meter.no] = sensor
 
     async_add_entities(sensors)
 
@@ -54,6 +69,7 @@ class HaUsmsUtilityMeterRemainingUnit(HaUsmsEntity, SensorEntity):
     """HaUsmsUtilityMeterRemainingUnit Sensor class."""
 
     _attr_native_value: float = 0.0
+    _attr_state_class = SensorStateClass.MEASUREMENT
 
     def __init__(
         self,
@@ -61,50 +77,35 @@ class HaUsmsUtilityMeterRemainingUnit(HaUsmsEntity, SensorEntity):
         meter: USMSMeter,
     ) -> None:
         """Initialize the sensor class."""
-        super().__init__(coordinator)
-
-        self.meter = meter
+        super().__init__(coordinator, meter)
 
+        self._attr_device_class = _UNIT_DEVICE_CLASS.get(self._meter_type)
+        self._attr_native_unit_of_measurement = self._unit
         self._attr_native_value = self.meter.get_remaining_unit()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Update sensor with latest data from coordinator."""
-        if self.available:
-            self._attr_native_value = self.meter.get_remaining_unit()
+        if not self.available:
+            return
 
-            self.async_write_ha_state()
-            LOGGER.debug(f"Updated {self.unique_id}")
+        native_value = self.meter.get_remaining_unit()
+        if native_value == self._attr_native_value:
+            return
+        self._attr_native_value = native_value
 
-    @property
-    def device_class(self) -> str | None:
-        """Return device class."""
-        if self.meter.get_type() == "Electricity":
-            return SensorDeviceClass.ENERGY_STORAGE
-        if self.meter.get_type() == "Water":
-            return SensorDeviceClass.WATER
-        return None
-
-    @property
-    def name(self) -> str:
-        """Return the name of the meter."""
-        return f"{self.meter.get_type()} Meter {self.meter.get_no()}"
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Return unit of meter."""
-        return self.meter.get_unit()
-
-    @property
-    def state_class(self) -> str:
-        """Return state class."""
-        return SensorStateClass.MEASUREMENT
+        self.async_write_ha_state()
+        LOGGER.debug("Updated %s", self.unique_id)
 
 
 class HaUsmsUtilityMeterRemainingCredit(HaUsmsEntity, SensorEntity):
     """HaUsmsUtilityMeterRemainingCredit Sensor class."""
 
     _attr_native_value: float = 0.0
+    _attr_device_class = SensorDeviceClass.MONETARY
+    _attr_native_unit_of_measurement = "BND"
+    _attr_state_class = None
+    _name_suffix = " Remaining Credit"
 
     def __init__(
         self,
@@ -112,46 +113,33 @@ class HaUsmsUtilityMeterRemainingCredit(HaUsmsEntity, SensorEntity):
         meter: USMSMeter,
     ) -> None:
         """Initialize the sensor class."""
-        super().__init__(coordinator)
-
-        self.meter = meter
+        super().__init__(coordinator, meter)
 
         self._attr_native_value = self.meter.get_remaining_credit()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Update sensor with latest data from coordinator."""
-        if self.available:
-            self._attr_native_value = self.meter.get_remaining_credit()
+        if not self.available:
+            return
 
-            self.async_write_ha_state()
-            LOGGER.debug(f"Updated {self.unique_id}")
+        native_value = self.meter.get_remaining_credit()
+        if native_value == self._attr_native_value:
+            return
+        self._attr_native_value = native_value
 
-    @property
-    def device_class(self) -> str | None:
-        """Return device class."""
-        return SensorDeviceClass.MONETARY
-
-    @property
-    def name(self) -> str:
-        """Return the name of the meter."""
-        return f"{self.meter.get_type()} Meter {self.meter.get_no()} Remaining Credit"
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Return unit of meter."""
-        return "BND"
-
-    @property
-    def state_class(self) -> str:
-        """Return state class."""
-        return None
+        self.async_write_ha_state()
+        LOGGER.debug("Updated %s", self.unique_id)
 
 
 class HaUsmsUtilityMeterLastUpdated(HaUsmsEntity, SensorEntity):
     """HaUsmsUtilityMeterLastUpdated Sensor class."""
 
     _attr_native_value: datetime = datetime.min.replace(tzinfo=USMSMeter.TIMEZONE)
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+    _attr_native_unit_of_measurement = None
+    _attr_state_class = None
+    _name_suffix = " Last Updated"
 
     def __init__(
         self,
@@ -159,100 +147,84 @@ class HaUsmsUtilityMeterLastUpdated(HaUsmsEntity, SensorEntity):
         meter: USMSMeter,
     ) -> None:
         """Initialize the sensor class."""
-        super().__init__(coordinator)
-
-        self.meter = meter
+        super().__init__(coordinator, meter)
 
         self._attr_native_value = self.meter.get_last_updated()
 
     @callback
     def _handle_coordinator_update(self) -> None:
         """Update sensor with latest data from coordinator."""
-        if self.available:
-            self._attr_native_value = self.meter.get_last_updated()
+        if not self.available:
+            return
 
-            self.async_write_ha_state()
-            LOGGER.debug(f"Updated {self.unique_id}")
+        native_value = self.meter.get_last_updated()
+        if native_value == self._attr_native_value:
+            return
+        self._attr_native_value = native_value
 
-    @property
-    def device_class(self) -> str | None:
-        """Return device class."""
-        return SensorDeviceClass.TIMESTAMP
-
-    @property
-    def name(self) -> str:
-        """Return the name of the meter."""
-        return f"{self.meter.get_type()} Meter {self.meter.get_no()} Last Updated"
-
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Return unit of meter."""
-        return None
-
-    @property
-    def state_class(self) -> str:
-        """Return state class."""
-        return None
+        self.async_write_ha_state()
+        LOGGER.debug("Updated %s", self.unique_id)
 
 
 class HaUsmsUtilityMeterConsumption(HaUsmsEntity, SensorEntity):
     """HaUsmsUtilityMeterConsumption Sensor class."""
 
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _name_suffix = " Consumption"
+
     def __init__(
         self,
         coordinator: HaUsmsDataUpdateCoordinator,
         meter: USMSMeter,
     ) -> None:
         """Initialize the sensor class."""
-        super().__init__(coordinator)
-
-        self.meter = meter
+        super().__init__(coordinator, meter)
 
+        self._attr_device_class = _CONSUMPTION_DEVICE_CLASS.get(self._meter_type)
+        self._attr_native_unit_of_measurement = self._unit
         self._attr_native_value = None
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Update sensor with latest data from coordinator."""
-        if self.available and self.coordinator.data.get(self.meter.no):
-            async_import_statistics(
-                self.coordinator.hass,
-                self.metadata,
-                self.coordinator.data[self.meter.no],
-            )
-            LOGGER.debug(f"Updated {self.unique_id}")
+        self._last_import_hash: int | None = None
 
-    @property
-    def device_class(self) -> str | None:
-        """Return device class."""
-        if self.meter.get_type() == "Electricity":
-            return SensorDeviceClass.ENERGY
-        if self.meter.get_type() == "Water":
-            return SensorDeviceClass.WATER
-        return None
-
-    @property
-    def metadata(self) -> StatisticMetaData:
-        """Return device class."""
-        return {
+        """The statistics metadata never changes, so only build it once."""
+        self._metadata: StatisticMetaData = {
             "has_mean": False,
             "has_sum": True,
-            "name": self.name,
+            "name": self._attr_name,
             "source": "recorder",
-            "statistic_id": f"sensor.{self.unique_id}",
-            "unit_of_measurement": self.native_unit_of_measurement,
+            "statistic_id": f"sensor.{self._attr_unique_id}",
+            "unit_of_measurement": self._unit,
         }
 
-    @property
-    def name(self) -> str:
-        """Return the name of the meter."""
-        return f"{self.meter.get_type()} Meter {self.meter.get_no()} Consumption"
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update sensor with latest data from coordinator."""
+        if not self.available:
+            return
+
+        statistics = self.coordinator.data.get(self.meter.no)
+        if not statistics:
+            return
+
+        """Skip re-importing exactly the same statistics as last time."""
+        import_hash = hash(
+            tuple(
+                (statistic["start"], statistic["state"], statistic.get("sum"))
+                for statistic in statistics
+            )
+        )
+        if import_hash == self._last_import_hash:
+            return
+        self._last_import_hash = import_hash
 
-    @property
-    def native_unit_of_measurement(self) -> str:
-        """Return unit of meter."""
-        return self.meter.get_unit()
+        async_import_statistics(
+            self.coordinator.hass,
+            self.metadata,
+            statistics,
+        )
+        LOGGER.debug("Updated %s", self.unique_id)
 
     @property
-    def state_class(self) -> str:
-        """Return state class."""
-        return SensorStateClass.TOTAL_INCREASING
+    def metadata(self) -> StatisticMetaData:
+        """Return statistics metadata."""
+        return self._metadata
@@ -1,6 +1,11 @@
 """Global services for HA-USMS."""
 
+from __future__ import annotations
+
+import asyncio
 from datetime import datetime, timedelta
+from itertools import accumulate
+from logging import DEBUG
 from typing import TYPE_CHECKING
 
 import voluptuous as vol
@@ -9,17 +14,31 @@ from homeassistant.components.recorder.statistics import (
     async_import_statistics,
     statistics_during_period,
 )
-from homeassistant.core import HomeAssistant, ServiceCall, SupportsResponse
+from homeassistant.core import (
+    HomeAssistant,
+    ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
+)
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.util import dt as dt_util
 from usms import USMSConsumptionHistoryNotFoundError, USMSMeter
 
-from .const import DOMAIN, LOGGER
-from .data import HaUsmsConfigEntry
+from .const import (
+    DOMAIN,
+    IMPORT_CHUNK_SIZE,
+    LOGGER,
+    ONE_HOUR,
+)
 
 if TYPE_CHECKING:
-    from homeassistant.components.recorder.models.statistics import StatisticData
+    from homeassistant.components.recorder.models.statistics import (
+        StatisticData,
+        StatisticMetaData,
+    )
 
     from .coordinator import HaUsmsDataUpdateCoordinator
+    from .data import HaUsmsConfigEntry
 
 DOWNLOAD_METER_CONSUMPTION_HISTORY_SERVICE_SCHEMA = vol.Schema(
     {
@@ -42,6 +61,12 @@ CALCULATE_COST_RESPONSE_SERVICE_SCHEMA = vol.Schema(
     }
 )
 
+"""Maps keywords in a given utility type to the USMS meter type."""
+_METER_TYPE_MAP = {
+    "electric": "Electricity",
+    "water": "Water",
+}
+
 
 class HaUsmsServicesSetup:
     """Class to handle Integration Services."""
@@ -89,6 +114,25 @@ class HaUsmsServicesSetup:
             supports_response=SupportsResponse.ONLY,
         )
 
+    async def _async_import_statistics(
+        self,
+        metadata: StatisticMetaData,
+        statistics: list[StatisticData],
+    ) -> None:
+        """
+        Import statistics to the database in fixed-size chunks.
+
+        Yields to the event loop between chunks,
+        so that a large import does not hold up everything else.
+        """
+        for i in range(0, len(statistics), IMPORT_CHUNK_SIZE):
+            async_import_statistics(
+                self.hass,
+                metadata,
+                statistics[i : i + IMPORT_CHUNK_SIZE],
+            )
+            await asyncio.sleep(0)
+
     async def download_meter_consumption_history(
         self, service_call: ServiceCall
     ) -> None:
@@ -97,11 +141,9 @@ class HaUsmsServicesSetup:
         sensor = self.coordinator.meter_consumptions.get(meter_no)
 
         """Makes sure the given meter number exists."""
-        try:
-            assert sensor is not None  # noqa: S101
-        except AssertionError as error:
+        if sensor is None:
             error_message = "Meter number does not exist."
-            raise HomeAssistantError(error_message) from error
+            raise HomeAssistantError(error_message)
 
         """Sets the start date as 0001-01-01 if not given."""
         start_date = service_call.data.get("start")
@@ -121,40 +163,58 @@ class HaUsmsServicesSetup:
                 tzinfo=USMSMeter.TIMEZONE,
             )
         else:
-            end_date = datetime.now(tz=USMSMeter.TIMEZONE)
+            end_date = dt_util.now(time_zone=USMSMeter.TIMEZONE)
+
+        """Only log every single day downloaded when actually debugging."""
+        debug_enabled = LOGGER.isEnabledFor(DEBUG)
 
         iter_date = end_date
-        historical_states = []
-        """Iterates descendingly from the end date to the start date."""
+        daily_chunks = []
+        """
+        Iterates descendingly from the end date to the start date,
+        one day at a time, since every request for a day goes through
+        the same USMS session and its single hidden form state.
+        """
         while iter_date >= start_date:
             try:
-                LOGGER.debug(
-                    f"Retrieving {sensor.name} historical data for {iter_date}"
-                )
+                if debug_enabled:
+                    LOGGER.debug(
+                        "Retrieving %s historical data for %s", sensor.name, iter_date
+                    )
 
-                hourly_consumptions = await self.hass.async_add_executor_job(
+                hourly_consumptions = await self.coordinator.async_add_usms_job(
                     sensor.meter.get_hourly_consumptions, iter_date
                 )
 
-                for hourly, consumption in reversed(hourly_consumptions.items()):
-                    historical_state: StatisticData = {
-                        "start": hourly - timedelta(hours=1),
+                day_rows: list[StatisticData] = [
+                    {
+                        "start": hourly - ONE_HOUR,
                         "state": consumption,
                     }
-                    historical_states.insert(0, historical_state)
-
-                LOGGER.debug(f"Retrieved {sensor.name} historical data for {iter_date}")
+                    for hourly, consumption in hourly_consumptions.items()
+                ]
+                daily_chunks.append(day_rows)
+
+                if debug_enabled:
+                    LOGGER.debug(
+                        "Retrieved %s historical data for %s", sensor.name, iter_date
+                    )
                 iter_date -= timedelta(days=1)
 
             except USMSConsumptionHistoryNotFoundError:
                 LOGGER.debug(
-                    f"Retrieved {sensor.name} historical data until {iter_date + timedelta(days=1)}"  # noqa: E501
+                    "Retrieved %s historical data until %s",
+                    sensor.name,
+                    iter_date + timedelta(days=1),
                 )
                 """Stops iterating once no more historical data can be obtained."""
                 break
 
+        """Puts the downloaded days back into chronological order."""
+        historical_states = [row for chunk in reversed(daily_chunks) for row in chunk]
+
         """Imports the downloaded data to the statistics table."""
-        async_import_statistics(self.hass, sensor.metadata, historical_states)
+        await self._async_import_statistics(sensor.metadata, historical_states)
 
     async def recalculate_meter_sum_statistics(self, service_call: ServiceCall) -> None:
         """Recalculates the sum statistical data for a given meter."""
@@ -162,11 +222,9 @@ class HaUsmsServicesSetup:
         sensor = self.coordinator.meter_consumptions.get(meter_no)
 
         """Makes sure the given meter number exists."""
-        try:
-            assert sensor is not None  # noqa: S101
-        except AssertionError as error:
+        if sensor is None:
             error_message = "Meter number does not exist."
-            raise HomeAssistantError(error_message) from error
+            raise HomeAssistantError(error_message)
 
         statistic_id = sensor.metadata["statistic_id"]
 
@@ -176,7 +234,7 @@ class HaUsmsServicesSetup:
         ).async_add_executor_job(
             statistics_during_period,
             self.hass,
-            datetime.fromtimestamp(0, tz=USMSMeter.TIMEZONE),
+            dt_util.utc_from_timestamp(0),
             None,
             [statistic_id],
             "hour",
@@ -186,32 +244,28 @@ class HaUsmsServicesSetup:
         old_statistics = old_statistics_dict.get(statistic_id)
 
         """But check if the data already exists in the database."""
-        try:
-            assert old_statistics is not None  # noqa: S101
-        except AssertionError as error:
+        if old_statistics is None:
             """Otherwise there is nothing to recalculate."""
             error_message = f"No statistical data found for {statistic_id}."
-            raise HomeAssistantError(error_message) from error
-
-        """Then, calculate the accumulative sum for the states incrementally."""
-        new_statistics = []
-        total = 0
-        for old_statistic in old_statistics:
-            total += old_statistic["state"]
-            start_time = datetime.fromtimestamp(
-                old_statistic["start"],
-                tz=USMSMeter.TIMEZONE,
-            )
-            new_statistic: StatisticData = {
-                "start": start_time,
+            raise HomeAssistantError(error_message)
+
+        """Then, calculate the accumulative sum for the states in a single pass."""
+        sums = accumulate(old_statistic["state"] for old_statistic in old_statistics)
+
+        tz = USMSMeter.TIMEZONE
+        fromtimestamp = datetime.fromtimestamp
+        new_statistics: list[StatisticData] = [
+            {
+                "start": fromtimestamp(old_statistic["start"], tz=tz),
                 "state": old_statistic["state"],
                 "sum": total,
             }
-            new_statistics.append(new_statistic)
+            for old_statistic, total in zip(old_statistics, sums, strict=True)
+        ]
 
         """Re-import the new data into the database."""
-        async_import_statistics(self.hass, sensor.metadata, new_statistics)
-        LOGGER.debug(f"Recalculated sum statistics for {sensor.unique_id}")
+        await self._async_import_statistics(sensor.metadata, new_statistics)
+        LOGGER.debug("Recalculated sum statistics for %s", sensor.unique_id)
 
     async def update_meters(self, service_call: ServiceCall) -> None:  # noqa: ARG002
         """Force update all meters."""
@@ -222,7 +276,7 @@ class HaUsmsServicesSetup:
     async def calculate_utility_cost_response_service(
         self,
         service_call: ServiceCall,
-    ) -> None:
+    ) -> ServiceResponse:
         """
         Calculate total cost of utility usage.
 
@@ -231,16 +285,20 @@ class HaUsmsServicesSetup:
         according to the utility type's tariff.
         """
         consumption = service_call.data["consumption"]
-        meter_type = service_call.data["type"]
-
-        if "electric" in meter_type.lower():
-            meter_type = "Electricity"
-        elif "water" in meter_type.lower():
-            meter_type = "Water"
-        else:
+        given_meter_type = service_call.data["type"].lower()
+
+        meter_type = next(
+            (
+                meter_type
+                for keyword, meter_type in _METER_TYPE_MAP.items()
+                if keyword in given_meter_type
+            ),
+            None,
+        )
+        if meter_type is None:
             error = "Meter type not valid."
             raise HomeAssistantError(error)
 
-        cost = USMSMeter.calculate_cost(USMSMeter, consumption, "Electricity")
+        cost = USMSMeter.calculate_cost(USMSMeter, consumption, meter_type)
 
         return {"cost": cost}